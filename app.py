@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import hashlib
 import logging
 import sys
+import time
 from pathlib import Path
 
 import streamlit as st
@@ -11,20 +13,50 @@ from streamlit_autorefresh import st_autorefresh
 from scribedash.config import load_settings
 from scribedash.google import build_service, list_sheet_titles, fetch_values, values_to_dataframe
 
-
-def main():
-    st.set_page_config(page_title="ScribeDash", layout="wide")
-    st.title("ScribeDash")
-    st.caption("Live view + pages. Use the sidebar to control refresh.")
-
-    # Configure logging for terminal visibility
+# Configure logging for terminal visibility once per process, not on every rerun
+if not logging.getLogger().handlers:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s | %(levelname)s | %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)],
-        force=True,
     )
-    log = logging.getLogger("scribedash")
+
+# Upper bound for adaptive polling; matches the max of the interval input.
+MAX_REFRESH_MS = 60_000
+log = logging.getLogger("scribedash")
+
+
+# Cache helpers live at module level to keep main() readable, matching the
+# overview page. Keyed on the credentials mtime so a rotated key rebuilds the
+# client; max_entries=1 evicts the stale one.
+@st.cache_resource(show_spinner=False, max_entries=1)
+def service_cached(p: Path, mtime: float):
+    return build_service(p)
+
+
+def get_service(p: Path):
+    return service_cached(p, p.stat().st_mtime)
+
+
+# Sheet titles cached to reduce API calls and log noise
+@st.cache_data(ttl=300, show_spinner=False)
+def titles_cached(creds_str: str, sid: str):
+    log.debug("Fetching sheet list for spreadsheet %s", sid)
+    return list_sheet_titles(get_service(Path(creds_str)), sid)
+
+
+# Values cached per refresh window: widget-driven reruns inside the window
+# reuse the last fetch, the next auto-refresh tick lands in a new window.
+# Returns (values, fetched_at) so the UI can show when data was actually fetched.
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def values_cached(creds_str: str, sid: str, sheet: str, window: int):
+    return fetch_values(get_service(Path(creds_str)), sid, sheet), datetime.now(timezone.utc)
+
+
+def main():
+    st.set_page_config(page_title="ScribeDash", layout="wide")
+    st.title("ScribeDash")
+    st.caption("Live view + pages. Use the sidebar to control refresh.")
 
     settings = load_settings(Path(__file__).resolve().parent)
     creds_path = settings.credentials_path
@@ -49,10 +81,6 @@ def main():
         live = st.toggle("Live refresh", value=True)
         st.page_link("pages/1_Executive_Overview.py", label="Executive Overview", icon="📊")
 
-    # Auto-refresh while live mode is on
-    if live:
-        st_autorefresh(interval=refresh_secs * 1000, key="auto-refresh")
-
     from scribedash.google import extract_spreadsheet_id
     spreadsheet_id = extract_spreadsheet_id(spreadsheet_input)
     if not spreadsheet_id:
@@ -60,19 +88,6 @@ def main():
         st.stop()
 
     try:
-        @st.cache_resource(show_spinner=False)
-        def service_cached(p: Path):
-            logging.getLogger("scribedash").debug("Building Sheets service …")
-            return build_service(p)
-
-        service = service_cached(creds_path)
-
-        # Sheet selection (titles cached to reduce API calls and log noise)
-        @st.cache_data(ttl=300, show_spinner=False)
-        def titles_cached(creds_str: str, sid: str):
-            log.debug("Fetching sheet list for spreadsheet %s", sid)
-            return list_sheet_titles(service_cached(Path(creds_str)), sid)
-
         sheet_titles = titles_cached(str(creds_path), spreadsheet_id)
         default_sheet = sheet_titles[0]
 
@@ -95,12 +110,38 @@ def main():
             st.session_state[last_sheet_key] = selected_sheet
         else:
             log.debug("Reading values from sheet '%s'", selected_sheet)
-        values = fetch_values(service, spreadsheet_id, selected_sheet)
-        df = values_to_dataframe(values)
+        window = int(time.time() // refresh_secs)
+        values, fetched_at = values_cached(str(creds_path), spreadsheet_id, selected_sheet, window)
+
+        # Track how many consecutive refresh windows returned identical data
+        digest = hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
+        if st.session_state.get("last_digest") != digest:
+            st.session_state["stable_ticks"] = 0
+        elif st.session_state.get("last_window") != window:
+            st.session_state["stable_ticks"] = st.session_state.get("stable_ticks", 0) + 1
+        st.session_state["last_digest"] = digest
+        st.session_state["last_window"] = window
+
+        # Auto-refresh while live mode is on. Armed after the digest update so a
+        # detected change snaps straight back to the configured interval, while an
+        # unchanged sheet backs off exponentially.
+        if live:
+            stable_ticks = st.session_state["stable_ticks"]
+            interval_ms = min(MAX_REFRESH_MS, refresh_secs * 1000 * (2 ** min(stable_ticks, 4)))
+            st_autorefresh(interval=interval_ms, key="auto-refresh")
+
+        # Rebuilding the frame is the costly part of a warm rerun; skip it when
+        # the values are identical to the ones behind the previous frame.
+        if st.session_state.get("df_digest") == digest:
+            df = st.session_state["df"]
+        else:
+            df = values_to_dataframe(values)
+            st.session_state["df"] = df
+            st.session_state["df_digest"] = digest
 
         st.subheader(f"Sheet: {selected_sheet}")
         st.caption(
-            f"Last fetched: {datetime.now(timezone.utc).astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')}"
+            f"Last fetched: {fetched_at.astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')}"
         )
         if df.empty:
             st.warning("No data found in the sheet.")
@@ -110,6 +151,9 @@ def main():
     except Exception as e:
         log.exception("Error while fetching sheet data: %s", e)
         st.error(f"Error: {e}")
+        # Keep polling at the base interval so transient API errors recover
+        if live:
+            st_autorefresh(interval=refresh_secs * 1000, key="auto-refresh")
         st.stop()
 
 
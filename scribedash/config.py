@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -15,14 +15,27 @@ class Settings:
     credentials_path: Path = Path("credentials.json")
 
 
+# root -> (.env mtime, Settings); avoids re-reading .env on every Streamlit rerun
+_SETTINGS_CACHE: Dict[Path, Tuple[float, Settings]] = {}
+
+
 def load_settings(root: Optional[Path] = None) -> Settings:
     """Load settings from .env with sensible fallbacks and aliases.
 
     Aliases supported for spreadsheet id: SPREADSHEET_ID, Spreadsheet_ID, SHEET_ID.
+    Results are cached per root until .env is touched, so a newly created .env
+    or newly added keys are picked up on the next call. Nothing is cached while
+    .env is missing or no spreadsheet id is set. load_dotenv does not override
+    variables already in the environment, so changing an existing value still
+    needs a restart.
     """
     root = root or Path(__file__).resolve().parents[1]
     env_path = root / ".env"
-    if env_path.exists():
+    mtime = env_path.stat().st_mtime if env_path.exists() else None
+    cached = _SETTINGS_CACHE.get(root)
+    if cached is not None and mtime is not None and cached[0] == mtime:
+        return cached[1]
+    if mtime is not None:
         load_dotenv(env_path)
 
     # Accept a few common aliases and strip quotes
@@ -42,4 +55,9 @@ def load_settings(root: Optional[Path] = None) -> Settings:
 
     creds_path = root / "credentials.json"
 
-    return Settings(spreadsheet_id=raw_id, refresh_secs=refresh_secs, credentials_path=creds_path)
+    settings = Settings(spreadsheet_id=raw_id, refresh_secs=refresh_secs, credentials_path=creds_path)
+    if mtime is not None and raw_id:
+        _SETTINGS_CACHE[root] = (mtime, settings)
+    else:
+        _SETTINGS_CACHE.pop(root, None)
+    return settings
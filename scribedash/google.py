@@ -5,17 +5,36 @@ from pathlib import Path
 import time
 import random
 import logging
-from typing import List
+from itertools import zip_longest
+from typing import Dict, List
 
 import pandas as pd
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+
+try:  # optional: faster JSON decoding for large values payloads
+    import orjson
+except ImportError:  # pragma: no cover - falls back to googleapiclient's json
+    orjson = None
 
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+
+_SPREADSHEET_ID_RE = re.compile(r"/d/([a-zA-Z0-9_-]+)")
 logger = logging.getLogger("scribedash")
 
 
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes response bodies with orjson."""
+
+    def deserialize(self, content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+
+
 def build_service(credentials_path: Path):
     """Build the Google Sheets service client.
 
@@ -23,16 +42,15 @@ def build_service(credentials_path: Path):
     """
     logger.debug("Building Sheets service …")
     creds = Credentials.from_service_account_file(str(credentials_path), scopes=SCOPES)
-    return build("sheets", "v4", credentials=creds, cache_discovery=False)
+    model = _OrjsonModel() if orjson is not None else None
+    return build("sheets", "v4", credentials=creds, cache_discovery=False, model=model)
 
 
 def extract_spreadsheet_id(text: str) -> str:
     if not text:
         return ""
-    m = re.search(r"/d/([a-zA-Z0-9-_]+)", text)
-    if m:
-        return m.group(1)
-    return text.strip()
+    m = _SPREADSHEET_ID_RE.search(text)
+    return m.group(1) if m else text.strip()
 
 
 def _with_retries(fn, *, attempts: int = 5, base_delay: float = 0.5, max_delay: float = 5.0):
@@ -80,6 +98,7 @@ def fetch_values(service, spreadsheet_id: str, sheet_title: str):
                 range=sheet_title,
                 valueRenderOption="FORMATTED_VALUE",
                 dateTimeRenderOption="FORMATTED_STRING",
+                fields="values",
             )
             .execute()
         )
@@ -88,13 +107,66 @@ def fetch_values(service, spreadsheet_id: str, sheet_title: str):
     return result.get("values", [])
 
 
+def _sheet_title(a1_range: str) -> str:
+    """Sheet title from an echoed A1 range, e.g. "'Patient Count'!A1:Z100"."""
+    title = a1_range.rsplit("!", 1)[0]
+    if len(title) >= 2 and title[0] == title[-1] == "'":
+        title = title[1:-1].replace("''", "'")
+    return title
+
+
+def fetch_values_batch(service, spreadsheet_id: str, ranges: List[str]) -> Dict[str, list]:
+    """Fetch several sheets in one values.batchGet round-trip.
+
+    Returns a mapping of sheet title -> raw values, keyed on the A1 range the
+    server echoes back so a missing or reordered entry can't shift data onto
+    the wrong tab. Titles absent from the response are simply not in the map.
+    """
+
+    def _call():
+        return (
+            service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                valueRenderOption="FORMATTED_VALUE",
+                dateTimeRenderOption="FORMATTED_STRING",
+                fields="valueRanges(range,values)",
+            )
+            .execute()
+        )
+
+    result = _with_retries(_call)
+    value_ranges = result.get("valueRanges", [])
+    return {_sheet_title(vr["range"]): vr.get("values", []) for vr in value_ranges}
+
+
+def _looks_like_headers(headers) -> bool:
+    """True if the row has a non-empty cell and no duplicates; bails on the first repeat."""
+    seen = set()
+    any_nonempty = False
+    for h in headers:
+        if h in seen:
+            return False
+        seen.add(h)
+        any_nonempty = any_nonempty or h != ""
+    return any_nonempty
+
+
 def values_to_dataframe(values):
     if not values:
         return pd.DataFrame()
-    max_len = max(len(r) for r in values)
-    rows = [r + [""] * (max_len - len(r)) for r in values]
-    headers = rows[0]
-    has_headers = any(h != "" for h in headers) and len(set(headers)) == len(headers)
-    if has_headers:
-        return pd.DataFrame(rows[1:], columns=headers)
-    return pd.DataFrame(rows)
+    width = max(len(r) for r in values)
+    headers = list(values[0]) + [""] * (width - len(values[0]))
+    has_headers = _looks_like_headers(headers)
+    body = values[1:] if has_headers else values
+    if not body:
+        # Header-only sheet: empty object columns, as a row-wise build would give
+        return pd.DataFrame(columns=headers)
+    # Sheets trims trailing blanks per row; transpose lazily into columns so
+    # ragged rows are padded without building a padded copy of each row.
+    cols = list(zip_longest(*body, fillvalue=""))
+    cols += [("",) * len(body)] * (width - len(cols))
+    names = headers if has_headers else range(width)
+    return pd.DataFrame({name: col for name, col in zip(names, cols)}, columns=list(names))
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, Tuple
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
-from .google import fetch_values, values_to_dataframe
+from .google import fetch_values_batch, values_to_dataframe
+
+
+# Month column names as they appear after normalization
+MONTH_ABBR_ORDER = ("jan", "feb", "mar", "apr", "may", "jun", "july", "august")
+MONTH_ABBR = frozenset(MONTH_ABBR_ORDER)
+# Substrings marking numeric Utilization columns (matched with `in`, not membership)
+MONTH_FULL_KEYS = ("january", "february", "march", "april", "may", "june", "july", "august", "average")
 
 
 @dataclass
@@ -15,86 +22,103 @@ class SheetResult:
     df: pd.DataFrame
 
 
-def _parse_int_safe(x) -> Optional[int]:
-    try:
-        return int(x)
-    except Exception:
-        return None
+_NORM_TABLE = str.maketrans({" ": "_"})
+
+
+def _normalize_columns(cols) -> list[str]:
+    """Header -> snake-ish key: strip, lowercase, spaces to underscores."""
+    return [str(c).strip().lower().translate(_NORM_TABLE) for c in cols]
 
 
-def _parse_float_safe(x) -> Optional[float]:
-    try:
-        return float(x)
-    except Exception:
-        return None
+def _to_int(s: pd.Series) -> pd.Series:
+    """Vectorized ``int(x)``: integer strings parse, numbers truncate, the rest is <NA>."""
+    num = pd.to_numeric(s, errors="coerce")
+    if pd.api.types.infer_dtype(s, skipna=True) in ("string", "mixed", "mixed-integer"):
+        # int() rejects non-integer strings such as "5.0"; non-string cells give NaN here
+        is_str = s.str.len().notna()
+        num = num.where(~is_str | s.str.fullmatch(r"\s*[+-]?\d+\s*", na=False))
+    # Values outside int64 would make the nullable cast raise for the whole column
+    num = num.where(num.abs() < 2**63)
+    return np.trunc(num).astype("Int64")
 
 
-def _parse_date_safe(x) -> Optional[datetime]:
-    # Expect dd/mm/yy or ISO-like strings from formatted values
-    for fmt in ("%d/%m/%y", "%Y-%m-%d", "%m/%d/%Y"):
-        try:
-            return datetime.strptime(str(x), fmt)
-        except Exception:
-            continue
-    return None
+def _to_date(s: pd.Series) -> pd.Series:
+    """Parse dates as dd/mm/yy, then YYYY-mm-dd, then mm/dd/YYYY; anything else is NaT.
 
+    Only these three formats are accepted, tried in that order like the original
+    per-cell strptime loop, but each as a single vectorized pass over the cells
+    still unparsed.
+    """
+    s = s.astype("string")
+    parsed = pd.to_datetime(s, format="%d/%m/%y", errors="coerce")
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
+        mask = parsed.isna() & s.notna()
+        if not mask.any():
+            break
+        parsed.loc[mask] = pd.to_datetime(s[mask], format=fmt, errors="coerce")
+    return parsed
 
-def load_patient_count(service, spreadsheet_id: str) -> SheetResult:
-    values = fetch_values(service, spreadsheet_id, "Patient Count")
+
+def _parse_patient_count(values) -> pd.DataFrame:
     df = values_to_dataframe(values)
     # Normalize column names
-    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    df.columns = _normalize_columns(df.columns)
     # Coerce month columns
-    for col in [
-        "jan",
-        "feb",
-        "mar",
-        "apr",
-        "may",
-        "jun",
-        "july",
-        "august",
-        "avg",
-    ]:
-        if col in df.columns:
-            df[col] = df[col].apply(_parse_int_safe)
-    return SheetResult("Patient Count", df)
-
-
-def load_utilization(service, spreadsheet_id: str) -> SheetResult:
-    values = fetch_values(service, spreadsheet_id, "Utilization")
+    num_cols = [c for c in df.columns if c in MONTH_ABBR or c == "avg"]
+    if num_cols:
+        df[num_cols] = df[num_cols].apply(_to_int)
+    return df
+
+
+def _parse_utilization(values) -> pd.DataFrame:
     df = values_to_dataframe(values)
-    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    df.columns = _normalize_columns(df.columns)
     # Attempt numeric coercion for utilization metrics
-    for c in df.columns:
-        if any(k in c for k in ["january", "february", "march", "april", "may", "june", "july", "august", "average"]):
-            df[c] = pd.to_numeric(df[c], errors="coerce")
-    return SheetResult("Utilization", df)
+    num_cols = [c for c in df.columns if any(k in c for k in MONTH_FULL_KEYS)]
+    if num_cols:
+        df[num_cols] = df[num_cols].apply(pd.to_numeric, errors="coerce")
+    return df
 
 
-def load_dataset(service, spreadsheet_id: str) -> SheetResult:
-    values = fetch_values(service, spreadsheet_id, "Dataset")
+def _parse_dataset(values) -> pd.DataFrame:
     df = values_to_dataframe(values)
-    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
-    return SheetResult("Dataset", df)
+    df.columns = _normalize_columns(df.columns)
+    return df
 
 
-def load_month_activity(service, spreadsheet_id: str, month_title: str) -> SheetResult:
-    values = fetch_values(service, spreadsheet_id, month_title)
+def _parse_month_activity(values) -> pd.DataFrame:
     df = values_to_dataframe(values)
     # expected columns (Name, Lead, Date, Primary, Task, Provider Covered, Backup Coverage, ...)
-    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    df.columns = _normalize_columns(df.columns)
     # Parse some typed columns when present
-    for c in ["scheduled", "uploaded"]:
-        if c in df.columns:
-            df[c] = df[c].apply(_parse_int_safe)
+    int_cols = [c for c in ["scheduled", "uploaded"] if c in df.columns]
+    if int_cols:
+        df[int_cols] = df[int_cols].apply(_to_int)
     if "date" in df.columns:
-        df["date_parsed"] = df["date"].apply(_parse_date_safe)
+        df["date_parsed"] = _to_date(df["date"])
     # Hours fields may be numeric strings
-    for c in ["scribe_hours", "provider_hours", "hours_difference"]:
-        if c in df.columns:
-            df[c] = df[c].apply(_parse_float_safe)
-    return SheetResult(month_title, df)
+    hour_cols = [c for c in ["scribe_hours", "provider_hours", "hours_difference"] if c in df.columns]
+    if hour_cols:
+        df[hour_cols] = df[hour_cols].apply(pd.to_numeric, errors="coerce")
+    return df
+
+
+def load_overview(
+    service, spreadsheet_id: str, month_title: str
+) -> Tuple[SheetResult, SheetResult, SheetResult, SheetResult]:
+    """Load Dataset, Patient Count, Utilization and the month tab in one batchGet.
+
+    Returns results in that order.
+    """
+    batch = fetch_values_batch(
+        service, spreadsheet_id, ["Dataset", "Patient Count", "Utilization", month_title]
+    )
+    return (
+        SheetResult("Dataset", _parse_dataset(batch.get("Dataset", []))),
+        SheetResult("Patient Count", _parse_patient_count(batch.get("Patient Count", []))),
+        SheetResult("Utilization", _parse_utilization(batch.get("Utilization", []))),
+        SheetResult(month_title, _parse_month_activity(batch.get(month_title, []))),
+    )
 
 
 def pick_current_month_title(candidates: list[str]) -> Tuple[str, list[str]]: